@@ -0,0 +1,140 @@
+"""
+tournament_parser パッケージのテスト
+使用方法: cd scripts && python3 -m pytest test_tournament_parser.py
+         （または python3 -m unittest test_tournament_parser）
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PDF = os.path.join(SCRIPTS_DIR, "result_1005226.pdf")
+HAS_PDFPLUMBER = importlib.util.find_spec("pdfplumber") is not None
+
+sys.path.insert(0, SCRIPTS_DIR)
+
+
+def run_python(*args, cwd=None):
+    """scripts ディレクトリを import パスに入れて別プロセスの python を実行"""
+    env = dict(os.environ, PYTHONPATH=SCRIPTS_DIR)
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd or SCRIPTS_DIR, env=env, capture_output=True, text=True,
+    )
+
+
+class LazyImportTest(unittest.TestCase):
+    """pdfplumber はPDFを開くまで読み込まれないこと"""
+
+    def test_import_does_not_load_pdfplumber(self):
+        result = run_python("-c", (
+            "import sys, tournament_parser\n"
+            "tournament_parser.TournamentParser, tournament_parser.debug_pdf_structure\n"
+            "print('pdfplumber' in sys.modules)"
+        ))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_help_does_not_load_pdfplumber(self):
+        result = run_python("-c", (
+            "import runpy, sys\n"
+            "sys.argv = ['tournament_parser', '--help']\n"
+            "try:\n"
+            "    runpy.run_module('tournament_parser', run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('pdfplumber' in sys.modules, 'dataclasses' in sys.modules)"
+        ))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(result.stdout.rstrip().endswith("False False"), result.stdout)
+
+    def test_dir_has_no_duplicates(self):
+        import tournament_parser
+        tournament_parser.TournamentParser
+        names = dir(tournament_parser)
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn("TournamentParser", names)
+
+
+class ToDictTest(unittest.TestCase):
+    """従来の pdf-parser.py と同じJSON形式を出力すること"""
+
+    def test_legacy_shape(self):
+        from tournament_parser import Match, Player, TournamentData
+
+        winner = Player(draw_no=1, registration_no="G0000001", seed="1", name="山田 太郎", club="TC")
+        data = TournamentData(tournament_name="大会", category="男子シングルス 35歳以上")
+        data.players[2] = Player(draw_no=2, is_bye=True)
+        data.players[1] = winner
+        data.matches.append(Match(round="1R", player1_draw_no=1, player2_draw_no=2,
+                                  winner_draw_no=1, score="BYE"))
+        data.winner = winner
+
+        self.assertEqual(data.to_dict(), {
+            "tournament": "大会",
+            "category": "男子シングルス 35歳以上",
+            "players": [
+                {"draw_no": 1, "registration_no": "G0000001", "seed": "1",
+                 "name": "山田 太郎", "club": "TC", "is_bye": False},
+                {"draw_no": 2, "registration_no": None, "seed": None,
+                 "name": None, "club": None, "is_bye": True},
+            ],
+            "matches": [
+                {"round": "1R", "player1_draw_no": 1, "player2_draw_no": 2,
+                 "winner_draw_no": 1, "score": "BYE"},
+            ],
+            "winner": "山田 太郎",
+        })
+
+
+class CliTest(unittest.TestCase):
+
+    def test_batch_rejects_duplicate_output_names(self):
+        result = run_python("-m", "tournament_parser", "batch", "a/result.pdf", "b/result.pdf")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("重複", result.stderr)
+
+    def test_wrapper_accepts_verbose(self):
+        result = run_python("pdf-parser.py", "-v", "missing.pdf")
+        self.assertEqual(result.returncode, 1, result.stderr)
+        self.assertIn("missing.pdf", result.stderr)
+
+    def test_wrapper_usage_shows_script_name(self):
+        result = run_python("pdf-parser.py")
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("usage: pdf-parser.py", result.stderr)
+
+    @unittest.skipUnless(HAS_PDFPLUMBER, "pdfplumber がインストールされていません")
+    def test_parse_stdout_is_json_only(self):
+        result = run_python("-m", "tournament_parser", "parse", SAMPLE_PDF, "-o", "-")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        output = json.loads(result.stdout)
+        self.assertEqual(output["category"], "男子シングルス 35歳以上")
+
+    @unittest.skipUnless(HAS_PDFPLUMBER, "pdfplumber がインストールされていません")
+    def test_parse_bad_output_path_reports_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "missing", "x.json")
+            result = run_python("-m", "tournament_parser", "parse", SAMPLE_PDF, "-o", output)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("エラーが発生しました", result.stderr)
+        self.assertNotIn("Traceback", result.stderr)
+
+    @unittest.skipUnless(HAS_PDFPLUMBER, "pdfplumber がインストールされていません")
+    def test_batch_parses_multiple_categories(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run_python("-m", "tournament_parser", "batch", SAMPLE_PDF,
+                                "-c", "男子シングルス 35歳以上", "-c", "存在しないカテゴリ",
+                                "-d", tmp)
+            self.assertEqual(result.returncode, 1)
+            self.assertIn("存在しないカテゴリのページが見つかりません", result.stderr)
+            self.assertEqual(os.listdir(tmp), ["result_1005226_男子シングルス_35歳以上.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
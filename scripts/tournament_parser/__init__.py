@@ -0,0 +1,45 @@
+"""
+JTA トーナメント表PDFパーサー
+
+使用例:
+    from tournament_parser import TournamentParser
+    data = TournamentParser("result_1005226.pdf").parse_category("男子シングルス 35歳以上")
+    print(data.to_dict())
+
+各属性は初回アクセス時にimportする（CLIの起動を速くするため）。
+typing や dataclasses もここではimportしない。
+pdfplumber は実際にPDFを開くまで読み込まれない。
+"""
+
+__all__ = [
+    "DEFAULT_CATEGORY",
+    "Match",
+    "Player",
+    "TournamentData",
+    "TournamentParser",
+    "debug_pdf_structure",
+]
+
+DEFAULT_CATEGORY = "男子シングルス 35歳以上"
+
+_LAZY_ATTRS = {
+    "TournamentParser": "parser",
+    "Match": "models",
+    "Player": "models",
+    "TournamentData": "models",
+    "debug_pdf_structure": "debug",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
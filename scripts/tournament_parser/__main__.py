@@ -0,0 +1,6 @@
+"""python3 -m tournament_parser で CLI を起動"""
+
+from .cli import main
+
+if __name__ == "__main__":
+    main()
